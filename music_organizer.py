@@ -5,23 +5,126 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable
 import subprocess
+import contextlib
+import copy
+import string
+import struct
+import functools
+import threading
+from types import MappingProxyType
+from io import BytesIO
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import mutagen
     from mutagen.flac import FLAC
     from mutagen.mp3 import MP3
+    from mutagen.mp4 import MP4, MP4Tags
+    from mutagen.id3 import ID3
+    from mutagen.wave import WAVE
+    from mutagen.aac import AAC
     from mutagen import File
 except ImportError:
     print("Error: Required dependencies not installed.")
     print("Please run: pip install mutagen")
     sys.exit(1)
 
+# Format classes keyed by suffix, so known formats skip File()'s sniffing
+_LOADERS = {
+    '.flac': FLAC,
+    '.mp3': MP3,
+    '.m4a': MP4,
+    '.wav': WAVE,
+    '.aac': AAC,
+}
+
+# Metadata field -> tag key for each tag flavour
+_VORBIS_KEYS = {
+    'title': 'title',
+    'artist': 'artist',
+    'album': 'album',
+    'genre': 'genre',
+    'bpm': 'bpm',
+    'date': 'date',
+    'tracknumber': 'tracknumber',
+}
+_ID3_KEYS = {
+    'title': 'TIT2',
+    'artist': 'TPE1',
+    'album': 'TALB',
+    'genre': 'TCON',
+    'bpm': 'TBPM',
+    'date': 'TDRC',
+    'tracknumber': 'TRCK',
+}
+_MP4_KEYS = {
+    'title': '\xa9nam',
+    'artist': '\xa9ART',
+    'album': '\xa9alb',
+    'genre': '\xa9gen',
+    'bpm': 'tmpo',
+    'date': '\xa9day',
+    'tracknumber': 'trkn',
+}
+
+def _first_value(value) -> str:
+    """Default tag conversion: first value as a string"""
+    return str(value[0])
+
+# Tag keys whose values need more than str() of the first item
+_TAG_CONVERTERS = {
+    # MP4 track numbers are (number, total) tuples
+    'trkn': lambda value: str(value[0][0]),
+    # ID3 genres may be numeric references like "(17)"; .genres resolves them
+    'TCON': lambda frame: frame.genres[0] if frame.genres else '',
+}
+
+# Most tag blocks fit in the start of the file, so read this much up front
+HEADER_PREFETCH_SIZE = 128 * 1024
+
+# Characters stripped from filename components, newlines become spaces
+_FILENAME_TRANS = str.maketrans({
+    **{c: None for c in '<>:"/\\|?*'},
+    '\n': ' ',
+    '\r': ' ',
+})
+
+def compile_rules(rules: Dict) -> Callable[[Dict], bool]:
+    """Turn a smart playlist rule dict into a metadata predicate
+    
+    The predicate expects metadata with a pre-lowercased 'genre_lc' key.
+    """
+    min_tempo = rules.get('min_tempo')
+    max_tempo = rules.get('max_tempo')
+    genres = rules.get('genre')
+    if genres is not None:
+        # Handle both string and list of genres
+        if isinstance(genres, str):
+            genres = [genres]
+        genres = frozenset(genre.lower() for genre in genres)
+    
+    def matches(metadata: Dict) -> bool:
+        tempo = metadata.get('tempo', 0)
+        if min_tempo is not None and tempo < min_tempo:
+            return False
+        if max_tempo is not None and tempo > max_tempo:
+            return False
+        if genres is not None:
+            genre = metadata['genre_lc']
+            if not any(g in genre for g in genres):
+                return False
+        return True
+    
+    return matches
+
 class Config:
     """Configuration management for the music organizer"""
     
-    DEFAULT_CONFIG = {
+    # Read-only at the top level; nested values are copied by default_data
+    DEFAULT_CONFIG = MappingProxyType({
         "music_root": "~/Music",
         "all_songs_dir": "All Songs",
         "playlists_dir": ".",
@@ -39,12 +142,15 @@ class Config:
         "file_naming": "{artist} - {title}",
         "auto_import": False,
         "backup_playlists": True
-    }
+    })
     
     def __init__(self):
         self.config_dir = Path.home() / ".config" / "music-organizer"
         self.config_file = self.config_dir / "config.json"
         self.data = {}
+        self.compiled_rules: Dict[str, Callable[[Dict], bool]] = {}
+        self.naming_parts: Optional[List[tuple]] = None
+        self._defer = False
         self.load_config()
     
     def load_config(self):
@@ -54,20 +160,50 @@ class Config:
         if self.config_file.exists():
             try:
                 with open(self.config_file, 'r') as f:
-                    self.data = json.load(f)
+                    loaded = json.load(f)
+                # Defaults fill in any keys missing from the file
+                self.data = {**self.default_data(), **loaded}
                 print(f"Loaded configuration from {self.config_file}")
             except Exception as e:
                 print(f"Error loading config: {e}. Using defaults.")
-                self.data = self.DEFAULT_CONFIG.copy()
+                self.data = self.default_data()
         else:
-            self.data = self.DEFAULT_CONFIG.copy()
+            self.data = self.default_data()
             self.save_config()
             print(f"Created default configuration at {self.config_file}")
         
-        # Ensure all default keys exist
-        for key, value in self.DEFAULT_CONFIG.items():
-            if key not in self.data:
-                self.data[key] = value
+        self.compile_smart_playlists()
+        self.compile_file_naming()
+    
+    def default_data(self) -> Dict:
+        """Fresh copy of the defaults, safe to modify in place"""
+        return copy.deepcopy(dict(self.DEFAULT_CONFIG))
+    
+    def compile_file_naming(self):
+        """Pre-parse the file naming pattern into (literal, field) pairs
+        
+        Left as None when the pattern uses format specs, conversions or
+        attribute/index lookups (or doesn't parse), in which case callers
+        fall back to str.format.
+        """
+        pattern = self.data.get('file_naming', '{artist} - {title}')
+        self.naming_parts = None
+        try:
+            parts = []
+            for literal, field, spec, conversion in string.Formatter().parse(pattern):
+                if spec or conversion or (field is not None and not field.isidentifier()):
+                    return
+                parts.append((literal, field))
+        except ValueError:
+            return
+        self.naming_parts = parts
+    
+    def compile_smart_playlists(self):
+        """Precompile smart playlist rules into predicates"""
+        self.compiled_rules = {
+            name: compile_rules(rules)
+            for name, rules in self.data.get('smart_playlists', {}).items()
+        }
     
     def save_config(self):
         """Save configuration to file"""
@@ -86,15 +222,44 @@ class Config:
             return Path(path).expanduser()
         return None
     
+    @contextlib.contextmanager
+    def batch(self):
+        """Defer update_setting writes and save once at the end of the block"""
+        if self._defer:
+            yield  # Nested batch, the outer one saves
+            return
+        self._defer = True
+        try:
+            yield
+        finally:
+            self._defer = False
+            self.save_config()
+    
     def update_setting(self, key, value):
         """Update a configuration setting"""
         self.data[key] = value
-        return self.save_config()
+        if key == 'smart_playlists':
+            self.compile_smart_playlists()
+        elif key == 'file_naming':
+            self.compile_file_naming()
+        return True if self._defer else self.save_config()
 
 class MusicOrganizer:
     def __init__(self):
         self.config = Config()
         self.setup_paths()
+        
+        # Playlist entries read from disk and entries pending a write,
+        # kept per organize run so each playlist is read and written once
+        self._playlist_cache: Dict[Path, set] = {}
+        self._playlist_appends: Dict[Path, List[str]] = {}
+        self._playlist_batch_depth = 0
+        
+        # Snapshot of the playlists directory, see get_available_playlists
+        self._playlists_cache: Optional[List[Path]] = None
+        
+        # Per-thread scratch space for the FLAC tag reader and header prefetch
+        self._scratch = threading.local()
     
     def setup_paths(self):
         """Setup directory paths from configuration"""
@@ -109,39 +274,151 @@ class MusicOrganizer:
     def parse_audio_metadata(self, file_path: Path) -> Dict:
         """Extract metadata from various audio formats"""
         try:
-            audio = File(file_path)
+            if file_path.suffix.lower() == '.flac':
+                tags = self._fast_flac_tags(file_path)
+                if tags is not None:
+                    return self._metadata_from_dict(tags, file_path)
+            
+            audio = self._load_audio(file_path)
             if audio is None:
                 return self._get_fallback_metadata(file_path)
             
-            metadata = {
-                'title': self._get_tag(audio, 'title', file_path.stem),
-                'artist': self._get_tag(audio, 'artist', 'Unknown Artist'),
-                'album': self._get_tag(audio, 'album', 'Unknown Album'),
-                'genre': self._get_tag(audio, 'genre', 'Unknown'),
-                'tempo': self._parse_tempo(self._get_tag(audio, 'bpm', '0')),
-                'date': self._get_tag(audio, 'date', ''),
-                'tracknumber': self._get_tag(audio, 'tracknumber', ''),
-                'file_path': file_path
-            }
-            
-            return metadata
+            return self._metadata_from_dict(self._extract(audio), file_path)
             
         except Exception as e:
             print(f"Error reading metadata from {file_path}: {e}")
             return self._get_fallback_metadata(file_path)
     
-    def _get_tag(self, audio, tag, default):
-        """Safely get tag from audio file"""
+    def _load_audio(self, file_path: Path):
+        """Open file with the mutagen class matching its extension"""
+        loader = _LOADERS.get(file_path.suffix.lower())
+        if loader is not None:
+            audio = self._load_prefetched(loader, file_path)
+            if audio is not None:
+                return audio
+            try:
+                return loader(file_path)
+            except mutagen.MutagenError:
+                pass  # Mislabelled file, let mutagen sniff the format
+        return File(file_path)
+    
+    def _load_prefetched(self, loader, file_path: Path):
+        """Parse from an in-memory copy of the file header
+        
+        Returns None when the header alone isn't enough (parse error, or no
+        tags found in a truncated view, e.g. ID3v1/APEv2 at end of file).
+        """
+        buf = getattr(self._scratch, 'hdr', None)
+        if buf is None:
+            buf = self._scratch.hdr = bytearray(HEADER_PREFETCH_SIZE)
+        
+        with open(file_path, 'rb') as f:
+            n = f.readinto(buf)
+        truncated = n == len(buf)
+        
         try:
-            if hasattr(audio, 'tags') and audio.tags is not None:
-                if tag in audio.tags:
-                    value = audio.tags[tag]
-                    if isinstance(value, list):
-                        return str(value[0])
-                    return str(value)
-        except:
-            pass
-        return default
+            audio = loader(BytesIO(bytes(memoryview(buf)[:n])))
+        except Exception:
+            return None
+        
+        if truncated and not audio.tags:
+            return None
+        return audio
+    
+    def _fast_flac_tags(self, file_path: Path) -> Optional[Dict[str, str]]:
+        """Read Vorbis comments straight from the FLAC metadata blocks
+        
+        Returns None when the file doesn't look like plain FLAC so the
+        caller can fall back to mutagen.
+        """
+        # Scratch buffer is reused across files, one per worker thread
+        buf = getattr(self._scratch, 'buf', None)
+        if buf is None:
+            buf = self._scratch.buf = bytearray(4096)
+        
+        with open(file_path, 'rb') as f:
+            if f.read(4) != b'fLaC':
+                return None
+            
+            while True:
+                header = f.read(4)
+                if len(header) < 4:
+                    return None
+                is_last = header[0] & 0x80
+                block_type = header[0] & 0x7F
+                length = int.from_bytes(header[1:], 'big')
+                
+                if block_type != 4:  # Not VORBIS_COMMENT
+                    if is_last:
+                        return {}
+                    f.seek(length, os.SEEK_CUR)
+                    continue
+                
+                if len(buf) < length:
+                    buf = self._scratch.buf = bytearray(length)
+                if f.readinto(memoryview(buf)[:length]) < length:
+                    return None
+                break
+        
+        # Vorbis comment layout: vendor string, entry count, then
+        # length-prefixed "KEY=value" entries (all lengths u32 LE). Parse
+        # from a view limited to this block so a short or corrupt block
+        # raises instead of reading a previous file's leftover bytes.
+        tags = {}
+        with memoryview(buf)[:length] as block:
+            try:
+                vendor_length, = struct.unpack_from('<I', block, 0)
+                offset = 4 + vendor_length
+                count, = struct.unpack_from('<I', block, offset)
+                offset += 4
+                for _ in range(count):
+                    entry_length, = struct.unpack_from('<I', block, offset)
+                    offset += 4
+                    if offset + entry_length > length:
+                        return None
+                    entry = bytes(block[offset:offset + entry_length]).decode('utf-8', 'replace')
+                    offset += entry_length
+                    key, sep, value = entry.partition('=')
+                    if sep:
+                        tags.setdefault(key.lower(), value)
+            except struct.error:
+                return None
+        
+        return tags
+    
+    def _metadata_from_dict(self, tags: Dict[str, str], file_path: Path) -> Dict:
+        """Build metadata from an already decoded tag dict"""
+        genre = tags.get('genre', 'Unknown')
+        return {
+            'title': tags.get('title', file_path.stem),
+            'artist': tags.get('artist', 'Unknown Artist'),
+            'album': tags.get('album', 'Unknown Album'),
+            'genre': genre,
+            'genre_lc': genre.lower(),
+            'tempo': self._parse_tempo(tags.get('bpm', '0')),
+            'date': tags.get('date', ''),
+            'tracknumber': tags.get('tracknumber', ''),
+            'file_path': file_path
+        }
+    
+    def _extract(self, audio) -> Dict[str, str]:
+        """Read all known fields from audio tags in one pass"""
+        tags = audio.tags
+        if not tags:
+            return {}
+        
+        if isinstance(tags, ID3):
+            keymap = _ID3_KEYS
+        elif isinstance(tags, MP4Tags):
+            keymap = _MP4_KEYS
+        else:
+            keymap = _VORBIS_KEYS
+        
+        # Present but empty tags stay '', matching the FLAC fast path
+        return {
+            field: _TAG_CONVERTERS.get(key, _first_value)(tags[key])
+            for field, key in keymap.items() if key in tags
+        }
     
     def _parse_tempo(self, tempo_str):
         """Parse tempo string to integer"""
@@ -157,6 +434,7 @@ class MusicOrganizer:
             'artist': 'Unknown Artist',
             'album': 'Unknown Album',
             'genre': 'Unknown',
+            'genre_lc': 'unknown',
             'tempo': 0,
             'date': '',
             'tracknumber': '',
@@ -165,77 +443,122 @@ class MusicOrganizer:
     
     def find_music_files(self, custom_source_dirs: List[str] = None) -> List[Path]:
         """Find music files in source directories"""
+        return list(self.iter_music_files(custom_source_dirs))
+    
+    def iter_music_files(self, custom_source_dirs: List[str] = None):
+        """Yield music files in source directories as they are found
+        
+        The All Songs directory is skipped when it sits inside a source
+        directory, since everything in it is already organized.
+        """
         source_dirs = custom_source_dirs or self.config.data.get('source_dirs', [])
         supported_formats = self.config.data.get('supported_formats', ['.flac', '.mp3'])
+        # Matched against lowercased names with one endswith call per file
+        ext_tuple = tuple(ext.lower() for ext in supported_formats)
+        all_songs_real = str(self.all_songs_dir.resolve())
         
-        music_files = []
         for source_dir in source_dirs:
             source_path = Path(source_dir).expanduser()
             if not source_path.exists():
                 print(f"Warning: Source directory {source_path} does not exist")
                 continue
-                
-            for ext in supported_formats:
+            
+            # Single walk per source dir; DirEntry caches the file type so
+            # no extra stat is needed per entry. Each directory is tracked
+            # with its resolved path too; symlinked dirs aren't followed, so
+            # a child's resolved path is just parent + name.
+            stack = [(str(source_path), str(source_path.resolve()))]
+            while stack:
+                current, current_real = stack.pop()
                 try:
-                    music_files.extend(source_path.rglob(f"*{ext}"))
-                    music_files.extend(source_path.rglob(f"*{ext.upper()}"))
-                except Exception as e:
-                    print(f"Error scanning {source_path} for {ext}: {e}")
-        
-        return music_files
+                    # Snapshot the listing so the directory handle isn't held
+                    # open (and the listing doesn't shift) while callers work
+                    with os.scandir(current) as it:
+                        entries = list(it)
+                except OSError as e:
+                    print(f"Error scanning {current}: {e}")
+                    continue
+                
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            entry_real = os.path.join(current_real, entry.name)
+                            if entry_real != all_songs_real:
+                                stack.append((entry.path, entry_real))
+                        elif entry.is_file(follow_symlinks=False):
+                            if entry.name.lower().endswith(ext_tuple):
+                                yield Path(entry.path)
+                    except OSError:
+                        continue
     
     def generate_filename(self, metadata: Dict) -> str:
         """Generate filename based on naming pattern"""
-        pattern = self.config.data.get('file_naming', '{artist} - {title}')
-        
         # Clean components for filename safety
-        artist = self._clean_filename(metadata['artist'])
-        title = self._clean_filename(metadata['title'])
-        album = self._clean_filename(metadata['album'])
-        
-        filename = pattern.format(
-            artist=artist,
-            title=title,
-            album=album,
-            genre=metadata['genre'],
-            track=metadata['tracknumber']
-        )
+        fields = {
+            'artist': self._clean_filename(metadata['artist']),
+            'title': self._clean_filename(metadata['title']),
+            'album': self._clean_filename(metadata['album']),
+            'genre': metadata['genre'],
+            'track': metadata['tracknumber']
+        }
+        
+        parts = self.config.naming_parts
+        if parts is None:
+            pattern = self.config.data.get('file_naming', '{artist} - {title}')
+            filename = pattern.format(**fields)
+        else:
+            # Pattern was parsed at config load, just stitch the pieces
+            pieces = []
+            for literal, field in parts:
+                pieces.append(literal)
+                if field is not None:
+                    pieces.append(fields[field])
+            filename = "".join(pieces)
         
         # Add file extension
         file_path = metadata['file_path']
         return f"{filename}{file_path.suffix}"
     
-    def _clean_filename(self, name):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _clean_filename(name):
         """Clean string for use in filename"""
         if not name:
             return "Unknown"
         
         # Remove or replace problematic characters
-        cleaned = "".join(c for c in name if c not in '<>:"/\\|?*')
-        cleaned = cleaned.replace('\n', ' ').replace('\r', ' ')
-        cleaned = cleaned.strip()
+        cleaned = name.translate(_FILENAME_TRANS).strip()
         
         return cleaned if cleaned else "Unknown"
     
     def organize_file(self, file_path: Path, interactive: bool = True) -> bool:
         """Move and organize a single music file"""
+        metadata = self.parse_audio_metadata(file_path)
+        return self.organize_file_with_meta(file_path, metadata, interactive)
+    
+    def organize_file_with_meta(self, file_path: Path, metadata: Dict, interactive: bool = True) -> bool:
+        """Move and organize a single music file using already parsed metadata"""
         try:
-            metadata = self.parse_audio_metadata(file_path)
             new_filename = self.generate_filename(metadata)
             dest_path = self.all_songs_dir / new_filename
             
-            # Handle duplicate files
-            dest_path = self._handle_duplicates(dest_path)
-            
-            # Move file
-            shutil.move(str(file_path), str(dest_path))
-            print(f"✓ Moved: {file_path.name} → {dest_path.name}")
-            
-            # Update playlists
-            if interactive:
-                self.update_playlists_interactive(dest_path, metadata)
+            if dest_path.exists() and os.path.samefile(file_path, dest_path):
+                print(f"✓ Already organized: {dest_path.name}")
             else:
-                self.update_smart_playlists(dest_path, metadata)
+                # Handle duplicate files
+                dest_path = self._handle_duplicates(dest_path)
+                
+                # Move file
+                self._move_file(file_path, dest_path)
+                print(f"✓ Moved: {file_path.name} → {dest_path.name}")
+            
+            # Update playlists, resolving the new location only once
+            abs_path = str(dest_path.resolve())
+            with self._playlist_batch():
+                if interactive:
+                    self.update_playlists_interactive(abs_path, metadata)
+                else:
+                    self.update_smart_playlists(abs_path, metadata)
             
             return True
             
@@ -243,6 +566,15 @@ class MusicOrganizer:
             print(f"✗ Error organizing {file_path}: {e}")
             return False
     
+    def _move_file(self, file_path: Path, dest_path: Path):
+        """Move file, trying a plain rename before falling back to a copy"""
+        try:
+            os.replace(file_path, dest_path)
+        except OSError:
+            # Cross-device (including bind mounts sharing st_dev) or other
+            # rename failure; shutil.move copies when it has to
+            shutil.move(str(file_path), str(dest_path))
+    
     def _handle_duplicates(self, dest_path: Path) -> Path:
         """Handle duplicate filenames by adding counter"""
         if not dest_path.exists():
@@ -260,9 +592,15 @@ class MusicOrganizer:
     
     def get_available_playlists(self) -> List[Path]:
         """Get list of all .m3u files in playlists directory"""
-        return list(self.playlists_dir.glob("*.m3u"))
-    
-    def update_playlists_interactive(self, file_path: Path, metadata: Dict):
+        if self._playlists_cache is None:
+            with os.scandir(self.playlists_dir) as entries:
+                self._playlists_cache = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith('.m3u') and entry.is_file()
+                ]
+        return self._playlists_cache
+    
+    def update_playlists_interactive(self, abs_path: str, metadata: Dict):
         """Interactively add file to playlists"""
         playlists = self.get_available_playlists()
         
@@ -284,7 +622,7 @@ class MusicOrganizer:
         choice = input("\nSelect playlists (comma-separated numbers, 'a' for auto, 'n' for none): ").strip().lower()
         
         if choice == 'a':
-            self.update_smart_playlists(file_path, metadata)
+            self.update_smart_playlists(abs_path, metadata)
         elif choice == 'n':
             return
         elif choice:
@@ -292,19 +630,17 @@ class MusicOrganizer:
                 indices = [int(x.strip()) - 1 for x in choice.split(',')]
                 for idx in indices:
                     if 0 <= idx < len(playlists):
-                        self.add_to_playlist(playlists[idx], file_path)
+                        self.add_to_playlist(playlists[idx], abs_path)
             except ValueError:
                 print("Invalid input. Skipping playlist updates.")
     
-    def update_smart_playlists(self, file_path: Path, metadata: Dict):
+    def update_smart_playlists(self, abs_path: str, metadata: Dict):
         """Automatically add to smart playlists based on metadata"""
-        smart_playlists = self.config.data.get('smart_playlists', {})
         added_to = []
         
-        for playlist_name, rules in smart_playlists.items():
-            playlist_path = self.playlists_dir / playlist_name
-            if self.matches_rules(metadata, rules):
-                self.add_to_playlist(playlist_path, file_path)
+        for playlist_name, matches in self.config.compiled_rules.items():
+            if matches(metadata):
+                self.add_to_playlist(self.playlists_dir / playlist_name, abs_path)
                 added_to.append(playlist_name)
         
         if added_to:
@@ -312,38 +648,69 @@ class MusicOrganizer:
     
     def matches_rules(self, metadata: Dict, rules: Dict) -> bool:
         """Check if metadata matches smart playlist rules"""
-        for key, value in rules.items():
-            if key == 'min_tempo' and metadata.get('tempo', 0) < value:
-                return False
-            if key == 'max_tempo' and metadata.get('tempo', 0) > value:
-                return False
-            if key == 'genre':
-                # Handle both string and list of genres
-                if isinstance(value, list):
-                    if not any(genre.lower() in metadata.get('genre', '').lower() for genre in value):
-                        return False
-                elif value.lower() not in metadata.get('genre', '').lower():
-                    return False
-        return True
+        if 'genre_lc' not in metadata:
+            metadata = {**metadata, 'genre_lc': metadata.get('genre', '').lower()}
+        return compile_rules(rules)(metadata)
     
-    def add_to_playlist(self, playlist_path: Path, file_path: Path):
-        """Add file path to playlist"""
-        abs_path = file_path.resolve()
+    def add_to_playlist(self, playlist_path: Path, abs_path: str):
+        """Add resolved file path to playlist
         
-        # Create playlist if it doesn't exist
-        playlist_path.parent.mkdir(parents=True, exist_ok=True)
+        Inside a playlist batch the entry is queued and written when the
+        outermost batch ends; otherwise it is written right away.
+        """
+        # Load existing entries on first touch; the cache entry is set up
+        # front so a missing or unreadable playlist is only tried once
+        entries = self._playlist_cache.get(playlist_path)
+        if entries is None:
+            entries = self._playlist_cache[playlist_path] = set()
+            try:
+                with open(playlist_path, 'r', encoding='utf-8') as f:
+                    entries.update(line.strip() for line in f)
+            except FileNotFoundError:
+                # New playlist, created by flush_playlists. List it now so
+                # interactive prompts later in the run already offer it.
+                if (self._playlists_cache is not None
+                        and playlist_path.parent == self.playlists_dir
+                        and playlist_path.name.endswith('.m3u')):
+                    self._playlists_cache.append(playlist_path)
+            except Exception as e:
+                print(f"Error reading playlist {playlist_path}: {e}")
         
-        # Check if already in playlist
-        if playlist_path.exists():
-            with open(playlist_path, 'r', encoding='utf-8') as f:
-                existing_entries = [line.strip() for line in f.readlines()]
-            
-            if str(abs_path) in existing_entries:
-                return  # Already exists
+        if abs_path in entries:
+            return  # Already exists
         
-        # Add to playlist
-        with open(playlist_path, 'a', encoding='utf-8') as f:
-            f.write(f"{abs_path}\n")
+        entries.add(abs_path)
+        self._playlist_appends.setdefault(playlist_path, []).append(abs_path)
+        
+        if self._playlist_batch_depth == 0:
+            self.flush_playlists()
+    
+    @contextlib.contextmanager
+    def _playlist_batch(self):
+        """Queue playlist writes and flush them when the outermost batch ends"""
+        self._playlist_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._playlist_batch_depth -= 1
+            if self._playlist_batch_depth == 0:
+                self.flush_playlists()
+    
+    def flush_playlists(self):
+        """Write pending playlist entries, one write per playlist"""
+        for playlist_path, appends in self._playlist_appends.items():
+            try:
+                # Create playlist if it doesn't exist
+                if not playlist_path.exists():
+                    playlist_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._playlists_cache = None
+                with open(playlist_path, 'a', encoding='utf-8') as f:
+                    f.write("\n".join(appends) + "\n")
+            except Exception as e:
+                print(f"Error writing playlist {playlist_path}: {e}")
+        
+        self._playlist_cache.clear()
+        self._playlist_appends.clear()
     
     def create_sample_playlists(self):
         """Create sample playlists based on configuration"""
@@ -353,32 +720,73 @@ class MusicOrganizer:
             playlist_path = self.playlists_dir / playlist_name
             playlist_path.touch()
             print(f"  Created: {playlist_name}")
+        
+        self._playlists_cache = None
     
     def organize_all(self, interactive: bool = True, custom_source_dirs: List[str] = None):
         """Organize all music files found in source directories"""
-        music_files = self.find_music_files(custom_source_dirs)
-        
-        if not music_files:
-            print("No music files found in source directories.")
-            print(f"Current source directories: {self.config.data['source_dirs']}")
-            print(f"Supported formats: {self.config.data['supported_formats']}")
-            return
+        # Pick up playlists added since the last run
+        self._playlists_cache = None
         
-        print(f"Found {len(music_files)} music file(s) to organize:")
-        for file_path in music_files:
-            print(f"  - {file_path}")
-        
-        if interactive and len(music_files) > 0:
+        if interactive:
+            music_files = self.find_music_files(custom_source_dirs)
+            
+            if not music_files:
+                self._print_no_files()
+                return
+            
+            print(f"Found {len(music_files)} music file(s) to organize:")
+            for file_path in music_files:
+                print(f"  - {file_path}")
+            
             response = input("\nProceed with organization? (Y/n): ").strip().lower()
             if response in ['n', 'no']:
                 return
+        else:
+            # Stream files straight from the scan
+            music_files = self.iter_music_files(custom_source_dirs)
+        
+        success_count, total_count = self._organize_files(music_files, interactive)
         
+        if total_count == 0:
+            self._print_no_files()
+            return
+        
+        print(f"\n🎉 Organization complete! {success_count}/{total_count} files processed.")
+    
+    def _organize_files(self, music_files, interactive: bool):
+        """Organize files from any iterable, returning (succeeded, total)"""
+        # Metadata reads are I/O bound, so overlap them across a bounded
+        # window of files; moves and playlist updates stay on this thread
+        # to keep ordering intact
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        window = max_workers * 2
+        pending = deque()
         success_count = 0
-        for file_path in music_files:
-            if self.organize_file(file_path, interactive):
+        total_count = 0
+        
+        def organize_next():
+            nonlocal success_count, total_count
+            file_path, future = pending.popleft()
+            total_count += 1
+            if self.organize_file_with_meta(file_path, future.result(), interactive):
                 success_count += 1
         
-        print(f"\n🎉 Organization complete! {success_count}/{len(music_files)} files processed.")
+        with self._playlist_batch(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_path in music_files:
+                pending.append((file_path, executor.submit(self.parse_audio_metadata, file_path)))
+                if len(pending) >= window:
+                    organize_next()
+            while pending:
+                organize_next()
+        
+        return success_count, total_count
+    
+    def _print_no_files(self):
+        """Show where we looked when no music files were found"""
+        print("No music files found in source directories.")
+        print(f"Current source directories: {self.config.data['source_dirs']}")
+        print(f"Supported formats: {self.config.data['supported_formats']}")
     
     def show_config(self):
         """Display current configuration"""
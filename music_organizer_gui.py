@@ -1,4 +1,8 @@
 #!/usr/bin/env python3
+import queue
+import threading
+from contextlib import redirect_stdout
+
 try:
     import tkinter as tk
     from tkinter import ttk, messagebox, scrolledtext
@@ -7,13 +11,57 @@ except ImportError:
     print("Tkinter not available. GUI mode disabled.")
     raise
 
+class _QueueWriter:
+    """File-like object that forwards printed lines to the UI queue
+    
+    redirect_stdout swaps sys.stdout for the whole process, so the parse
+    workers print through this too. Partial lines are buffered per thread
+    so output from different threads doesn't get interleaved.
+    """
+    
+    def __init__(self, ui_queue):
+        self.ui_queue = ui_queue
+        self._lock = threading.Lock()
+        self._pending = {}
+    
+    def write(self, text):
+        thread_id = threading.get_ident()
+        with self._lock:
+            *lines, rest = (self._pending.pop(thread_id, "") + text).split("\n")
+            if rest:
+                self._pending[thread_id] = rest
+            for line in lines:
+                self.ui_queue.put(('log', line))
+        return len(text)
+    
+    def flush(self):
+        with self._lock:
+            rest = self._pending.pop(threading.get_ident(), "")
+            if rest:
+                self.ui_queue.put(('log', rest))
+    
+    def close(self):
+        """Forward whatever partial lines are left from any thread"""
+        with self._lock:
+            for rest in self._pending.values():
+                self.ui_queue.put(('log', rest))
+            self._pending.clear()
+
 class MusicOrganizerGUI:
     def __init__(self, root, organizer):
         self.root = root
         self.organizer = organizer
         self.root.title("Music Organizer")
         self.root.geometry("800x600")
+        
+        # Background work talks to Tk only through this queue
+        self._ui_queue = queue.Queue()
+        self._busy = False
+        self._close_requested = False
+        
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after(50, self._drain_queue)
     
     def setup_ui(self):
         # Create main frame
@@ -56,21 +104,13 @@ class MusicOrganizerGUI:
     def log(self, message):
         self.log_area.insert(tk.END, message + "\n")
         self.log_area.see(tk.END)
-        self.root.update()
     
     def organize_music(self):
-        self.progress.start()
-        self.log_area.delete(1.0, tk.END)
-        self.status.config(text="Organizing music files...")
-        
-        try:
-            self.organizer.organize_all(interactive=False)
-            self.status.config(text="Organization complete!")
-        except Exception as e:
-            self.log(f"Error: {e}")
-            self.status.config(text="Error occurred")
-        finally:
-            self.progress.stop()
+        self._run_in_background("Organizing music files...", self._organize)
+    
+    def _organize(self):
+        self.organizer.organize_all(interactive=False)
+        return "Organization complete!"
     
     def show_config(self):
         config = self.organizer.config.data
@@ -78,11 +118,63 @@ class MusicOrganizerGUI:
         messagebox.showinfo("Configuration", config_text)
     
     def rescan_files(self):
-        self.log_area.delete(1.0, tk.END)
+        self._run_in_background("Scanning for music files...", self._rescan)
+    
+    def _rescan(self):
         files = self.organizer.find_music_files()
-        self.log(f"Found {len(files)} music files:")
+        print(f"Found {len(files)} music files:")
         for file in files:
-            self.log(f"  - {file}")
+            print(f"  - {file}")
+        return "Ready"
+    
+    def _run_in_background(self, status, work):
+        """Run work() off the Tk thread; it returns the final status text"""
+        if self._busy:
+            return
+        self._busy = True
+        self.progress.start()
+        self.log_area.delete(1.0, tk.END)
+        self.status.config(text=status)
+        # Not a daemon: the run must finish its moves and playlist writes
+        threading.Thread(target=self._worker, args=(work,)).start()
+    
+    def _worker(self, work):
+        # Anything the organizer prints ends up in the log area
+        writer = _QueueWriter(self._ui_queue)
+        with redirect_stdout(writer):
+            try:
+                status = work()
+            except Exception as e:
+                print(f"Error: {e}")
+                status = "Error occurred"
+        writer.close()
+        self._ui_queue.put(('done', status))
+    
+    def _drain_queue(self):
+        """Apply updates queued by background work on the Tk thread"""
+        try:
+            while True:
+                kind, payload = self._ui_queue.get_nowait()
+                if kind == 'log':
+                    self.log(payload)
+                elif kind == 'done':
+                    self.progress.stop()
+                    self.status.config(text=payload)
+                    self._busy = False
+                    if self._close_requested:
+                        self.root.destroy()
+                        return
+        except queue.Empty:
+            pass
+        self.root.after(50, self._drain_queue)
+    
+    def _on_close(self):
+        """Close now, or once the running task has finished"""
+        if not self._busy:
+            self.root.destroy()
+            return
+        self._close_requested = True
+        self.status.config(text="Finishing current task, the window will close when done...")
 
 def launch_gui(organizer):
     root = tk.Tk()